@@ -9,6 +9,7 @@ This script compares token usage across different tool search implementations:
 Tests multiple query types to demonstrate different scaling characteristics.
 """
 
+import asyncio
 import sys
 import os
 import importlib.util
@@ -65,54 +66,66 @@ def run_test_without_tool_search(query: str) -> Dict:
     # Import the module
     module_path = os.path.join(os.path.dirname(__file__), '..', 'Without-Tool-Search-Tool', 'without_tool_search.py')
     module = load_module_from_file(module_path, 'without_tool_search')
-    
+
+    # The module's client is async; run the whole conversation on one event
+    # loop and close the client on that same loop (each call re-imports the
+    # module, so the client is per-test)
     client = module.client
-    messages = [{"role": "user", "content": query}]
-    
-    total_input_tokens = 0
-    total_output_tokens = 0
-    turns = 0
-    
-    # Run conversation
-    for turn in range(10):
-        turns += 1
-        
-        response = client.messages.create(
-            model=module.MODEL,
-            max_tokens=2048,
-            tools=module.TOOL_LIBRARY,
-            messages=messages,
-        )
-        
-        # Track tokens
-        total_input_tokens += response.usage.input_tokens
-        total_output_tokens += response.usage.output_tokens
-        
-        messages.append({"role": "assistant", "content": response.content})
-        
-        if response.stop_reason == "end_turn":
-            break
-        elif response.stop_reason == "tool_use":
-            tool_results = []
-            for block in response.content:
-                if block.type == "tool_use":
-                    mock_result = module.mock_tool_execution(block.name, block.input)
-                    tool_results.append({
-                        "type": "tool_result",
-                        "tool_use_id": block.id,
-                        "content": mock_result,
-                    })
-            if tool_results:
-                messages.append({"role": "user", "content": tool_results})
-        else:
-            break
-    
-    return {
-        "input_tokens": total_input_tokens,
-        "output_tokens": total_output_tokens,
-        "total_tokens": total_input_tokens + total_output_tokens,
-        "turns": turns
-    }
+
+    async def run_conversation() -> Dict:
+        messages = [{"role": "user", "content": query}]
+
+        total_input_tokens = 0
+        total_output_tokens = 0
+        turns = 0
+
+        for turn in range(10):
+            turns += 1
+
+            response = await client.messages.create(
+                model=module.MODEL,
+                max_tokens=2048,
+                tools=module.TOOL_LIBRARY,
+                messages=messages,
+            )
+
+            # Track tokens
+            total_input_tokens += response.usage.input_tokens
+            total_output_tokens += response.usage.output_tokens
+
+            messages.append({"role": "assistant", "content": response.content})
+
+            if response.stop_reason == "end_turn":
+                break
+            elif response.stop_reason == "tool_use":
+                tool_results = []
+                for block in response.content:
+                    if block.type == "tool_use":
+                        mock_result = module.mock_tool_execution(block.name, block.input)
+                        tool_results.append({
+                            "type": "tool_result",
+                            "tool_use_id": block.id,
+                            "content": mock_result,
+                        })
+                if tool_results:
+                    messages.append({"role": "user", "content": tool_results})
+            else:
+                break
+
+        return {
+            "input_tokens": total_input_tokens,
+            "output_tokens": total_output_tokens,
+            "total_tokens": total_input_tokens + total_output_tokens,
+            "turns": turns
+        }
+
+    async def run_and_close() -> Dict:
+        try:
+            return await run_conversation()
+        finally:
+            await client.close()
+
+    return asyncio.run(run_and_close())
 
 
 def run_test_with_embeddings(query: str) -> Dict:
@@ -196,72 +209,84 @@ def run_test_with_regex_or_bm25(query: str, method: str = "regex") -> Dict:
     # Import the module
     module_path = os.path.join(os.path.dirname(__file__), '..', 'Tool-Search-Tool', 'using-regex-or-bm25.py')
     module = load_module_from_file(module_path, 'using_regex_bm25')
-    
-    client = module.client
+
+    # The module's client is async and built lazily via get_client(); run the
+    # whole conversation on one event loop and close the client on that same
+    # loop (each call re-imports the module, so the client is per-test)
+    client = module.get_client()
     tools = module.create_tool_library(method)
-    messages = [{"role": "user", "content": query}]
-    
-    total_input_tokens = 0
-    total_output_tokens = 0
-    total_tool_search_requests = 0
-    turns = 0
-    
-    # Run conversation
-    for turn in range(10):
-        turns += 1
-        
-        response = client.messages.create(
-            model=module.MODEL,
-            max_tokens=2048,
-            tools=tools,
-            messages=messages,
-            extra_headers={
-                "anthropic-beta": "advanced-tool-use-2025-11-20"
-            }
-        )
-        
-        # Track tokens
-        usage = response.usage
-        total_input_tokens += usage.input_tokens
-        total_output_tokens += usage.output_tokens
-        
-        if hasattr(usage, 'server_tool_use') and usage.server_tool_use:
-            if hasattr(usage.server_tool_use, 'tool_search_requests'):
-                total_tool_search_requests += usage.server_tool_use.tool_search_requests
-        
-        messages.append({"role": "assistant", "content": response.content})
-        
-        if response.stop_reason == "end_turn":
-            break
-        elif response.stop_reason == "tool_use":
-            tool_results = []
-            for block in response.content:
-                if block.type == "tool_use":
-                    if block.name in ["tool_search_tool_regex", "tool_search_tool_bm25"]:
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": "",
-                        })
-                    else:
-                        mock_result = module.mock_tool_execution(block.name, block.input)
-                        tool_results.append({
-                            "type": "tool_result",
-                            "tool_use_id": block.id,
-                            "content": mock_result,
-                        })
-            if tool_results:
-                messages.append({"role": "user", "content": tool_results})
-        else:
-            break
-    
-    return {
-        "input_tokens": total_input_tokens,
-        "output_tokens": total_output_tokens,
-        "total_tokens": total_input_tokens + total_output_tokens,
-        "tool_search_requests": total_tool_search_requests,
-        "turns": turns
-    }
+
+    async def run_conversation() -> Dict:
+        messages = [{"role": "user", "content": query}]
+
+        total_input_tokens = 0
+        total_output_tokens = 0
+        total_tool_search_requests = 0
+        turns = 0
+
+        for turn in range(10):
+            turns += 1
+
+            response = await client.messages.create(
+                model=module.MODEL,
+                max_tokens=2048,
+                tools=tools,
+                messages=messages,
+                extra_headers={
+                    "anthropic-beta": "advanced-tool-use-2025-11-20"
+                }
+            )
+
+            # Track tokens
+            usage = response.usage
+            total_input_tokens += usage.input_tokens
+            total_output_tokens += usage.output_tokens
+
+            if hasattr(usage, 'server_tool_use') and usage.server_tool_use:
+                if hasattr(usage.server_tool_use, 'tool_search_requests'):
+                    total_tool_search_requests += usage.server_tool_use.tool_search_requests
+
+            messages.append({"role": "assistant", "content": response.content})
+
+            if response.stop_reason == "end_turn":
+                break
+            elif response.stop_reason == "tool_use":
+                tool_results = []
+                for block in response.content:
+                    if block.type == "tool_use":
+                        if block.name in ["tool_search_tool_regex", "tool_search_tool_bm25"]:
+                            tool_results.append({
+                                "type": "tool_result",
+                                "tool_use_id": block.id,
+                                "content": "",
+                            })
+                        else:
+                            mock_result = module.mock_tool_execution(block.name, block.input)
+                            tool_results.append({
+                                "type": "tool_result",
+                                "tool_use_id": block.id,
+                                "content": mock_result,
+                            })
+                if tool_results:
+                    messages.append({"role": "user", "content": tool_results})
+            else:
+                break
+
+        return {
+            "input_tokens": total_input_tokens,
+            "output_tokens": total_output_tokens,
+            "total_tokens": total_input_tokens + total_output_tokens,
+            "tool_search_requests": total_tool_search_requests,
+            "turns": turns
+        }
+
+    async def run_and_close() -> Dict:
+        try:
+            return await run_conversation()
+        finally:
+            await client.close()
+
+    return asyncio.run(run_and_close())
 
 
 def print_comparison_table(results: Dict):
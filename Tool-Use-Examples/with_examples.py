@@ -10,152 +10,159 @@ This demonstrates tool calling with input_examples that teach Claude:
 Expected accuracy improvement: 72% → 90%
 """
 
-import anthropic
 import json
 import os
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# NOTE: anthropic and dotenv are imported lazily in main() so importing this
+# module (e.g. to reuse the tool definition) doesn't pay the SDK import cost
 
-def get_ticket_tool_definition():
-    """Returns the create_ticket tool definition WITH input_examples."""
-    return {
-        "name": "create_ticket",
-        "description": """Creates a support ticket in the system. 
-        
-        Required fields: title
-        Optional fields: priority, labels, reporter (with nested contact info), due_date, escalation settings
-        """,
-        "input_schema": {
-            "type": "object",
-            "properties": {
-                "title": {
-                    "type": "string",
-                    "description": "Brief description of the ticket"
-                },
-                "priority": {
-                    "type": "string",
-                    "enum": ["low", "medium", "high", "critical"],
-                    "description": "Priority level of the ticket"
-                },
-                "labels": {
-                    "type": "array",
-                    "items": {"type": "string"},
-                    "description": "Tags for categorizing the ticket"
-                },
-                "reporter": {
-                    "type": "object",
-                    "description": "Information about the person reporting the ticket",
-                    "properties": {
-                        "id": {
-                            "type": "string",
-                            "description": "User identifier"
-                        },
-                        "name": {
-                            "type": "string",
-                            "description": "User's full name"
-                        },
-                        "contact": {
-                            "type": "object",
-                            "description": "Contact information",
-                            "properties": {
-                                "email": {
-                                    "type": "string",
-                                    "description": "Email address"
-                                },
-                                "phone": {
-                                    "type": "string",
-                                    "description": "Phone number"
-                                }
+# Banner separators, built once instead of re-running the string multiply
+# at every print site
+_EQ70 = "=" * 70
+_DASH70 = "─" * 70
+_DEQ70 = "═" * 70
+
+# The create_ticket tool definition WITH input_examples, built once at module
+# load. The SDK treats the tools list as read-only during a request, so the
+# same nested dict can be reused across calls without a defensive copy.
+TICKET_TOOL = {
+    "name": "create_ticket",
+    "description": """Creates a support ticket in the system. 
+    
+    Required fields: title
+    Optional fields: priority, labels, reporter (with nested contact info), due_date, escalation settings
+    """,
+    "input_schema": {
+        "type": "object",
+        "properties": {
+            "title": {
+                "type": "string",
+                "description": "Brief description of the ticket"
+            },
+            "priority": {
+                "type": "string",
+                "enum": ["low", "medium", "high", "critical"],
+                "description": "Priority level of the ticket"
+            },
+            "labels": {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": "Tags for categorizing the ticket"
+            },
+            "reporter": {
+                "type": "object",
+                "description": "Information about the person reporting the ticket",
+                "properties": {
+                    "id": {
+                        "type": "string",
+                        "description": "User identifier"
+                    },
+                    "name": {
+                        "type": "string",
+                        "description": "User's full name"
+                    },
+                    "contact": {
+                        "type": "object",
+                        "description": "Contact information",
+                        "properties": {
+                            "email": {
+                                "type": "string",
+                                "description": "Email address"
+                            },
+                            "phone": {
+                                "type": "string",
+                                "description": "Phone number"
                             }
                         }
                     }
-                },
-                "due_date": {
-                    "type": "string",
-                    "description": "Target completion date"
-                },
-                "escalation": {
-                    "type": "object",
-                    "description": "Escalation settings for urgent issues",
-                    "properties": {
-                        "level": {
-                            "type": "integer",
-                            "description": "Escalation level (1-3)"
-                        },
-                        "notify_manager": {
-                            "type": "boolean",
-                            "description": "Whether to notify the manager"
-                        },
-                        "sla_hours": {
-                            "type": "integer",
-                            "description": "SLA response time in hours"
-                        }
-                    }
                 }
             },
-            "required": ["title"]
-        },
-        # 🔑 KEY FEATURE: Tool Use Examples
-        "input_examples": [
-            # Example 1: Critical production bug - full details, escalation, tight SLA
-            {
-                "title": "Login page returns 500 error",
-                "priority": "critical",
-                "labels": ["bug", "authentication", "production"],
-                "reporter": {
-                    "id": "USR-12345",
-                    "name": "Jane Smith",
-                    "contact": {
-                        "email": "jane@acme.com",
-                        "phone": "+1-555-0123"
+            "due_date": {
+                "type": "string",
+                "description": "Target completion date"
+            },
+            "escalation": {
+                "type": "object",
+                "description": "Escalation settings for urgent issues",
+                "properties": {
+                    "level": {
+                        "type": "integer",
+                        "description": "Escalation level (1-3)"
+                    },
+                    "notify_manager": {
+                        "type": "boolean",
+                        "description": "Whether to notify the manager"
+                    },
+                    "sla_hours": {
+                        "type": "integer",
+                        "description": "SLA response time in hours"
                     }
-                },
-                "due_date": "2024-11-06",
-                "escalation": {
-                    "level": 2,
-                    "notify_manager": True,
-                    "sla_hours": 4
                 }
-            },
-            # Example 2: Feature request - reporter info, no escalation
-            {
-                "title": "Add dark mode support",
-                "labels": ["feature-request", "ui"],
-                "reporter": {
-                    "id": "USR-67890",
-                    "name": "Alex Chen"
+            }
+        },
+        "required": ["title"]
+    },
+    # 🔑 KEY FEATURE: Tool Use Examples
+    "input_examples": [
+        # Example 1: Critical production bug - full details, escalation, tight SLA
+        {
+            "title": "Login page returns 500 error",
+            "priority": "critical",
+            "labels": ["bug", "authentication", "production"],
+            "reporter": {
+                "id": "USR-12345",
+                "name": "Jane Smith",
+                "contact": {
+                    "email": "jane@acme.com",
+                    "phone": "+1-555-0123"
                 }
             },
-            # Example 3: Simple internal task - minimal fields
-            {
-                "title": "Update API documentation"
+            "due_date": "2024-11-06",
+            "escalation": {
+                "level": 2,
+                "notify_manager": True,
+                "sla_hours": 4
             }
-        ]
-    }
+        },
+        # Example 2: Feature request - reporter info, no escalation
+        {
+            "title": "Add dark mode support",
+            "labels": ["feature-request", "ui"],
+            "reporter": {
+                "id": "USR-67890",
+                "name": "Alex Chen"
+            }
+        },
+        # Example 3: Simple internal task - minimal fields
+        {
+            "title": "Update API documentation"
+        }
+    ]
+}
+
+
+def get_ticket_tool_definition():
+    """Returns the create_ticket tool definition WITH input_examples."""
+    return TICKET_TOOL
 
 def create_ticket(title, priority=None, labels=None, reporter=None, due_date=None, escalation=None):
     """Mock function to create a ticket (simulates API call)."""
-    ticket = {
+    optional = {
+        "priority": priority,
+        "labels": labels,
+        "reporter": reporter,
+        "due_date": due_date,
+        "escalation": escalation,
+    }
+    # One dict expansion instead of five conditional assignments; the filter
+    # keeps the original truthiness semantics (empty values are dropped)
+    return {
         "id": "TICKET-001",
         "title": title,
         "status": "open",
-        "created_at": "2024-11-28T20:00:00Z"
+        "created_at": "2024-11-28T20:00:00Z",
+        **{k: v for k, v in optional.items() if v},
     }
-    
-    if priority:
-        ticket["priority"] = priority
-    if labels:
-        ticket["labels"] = labels
-    if reporter:
-        ticket["reporter"] = reporter
-    if due_date:
-        ticket["due_date"] = due_date
-    if escalation:
-        ticket["escalation"] = escalation
-    
-    return ticket
 
 def process_tool_call(tool_name, tool_input):
     """Process the tool call and return results."""
@@ -167,23 +174,28 @@ def process_tool_call(tool_name, tool_input):
 
 def main():
     """Main function to run the ticket creation assistant."""
+    # Load environment variables and the SDK only when the CLI actually runs
+    from dotenv import load_dotenv
+    load_dotenv()
+    import anthropic
+
     client = anthropic.Anthropic(api_key=os.getenv("ANTHROPIC_API_KEY"))
     
-    print("=" * 70)
+    print(_EQ70)
     print("Support Ticket System - WITH Tool Use Examples (Enhanced)")
-    print("=" * 70)
+    print(_EQ70)
     print("\nThis version includes input_examples that teach Claude:")
     print("  ✅ Correct date formats (YYYY-MM-DD)")
     print("  ✅ Proper ID conventions (USR-XXXXX)")
     print("  ✅ Appropriate nested structure usage")
     print("  ✅ Strong parameter correlations")
     print("\n  Expected accuracy: 90% (vs 72% without examples)")
-    print("\n" + "=" * 70)
+    print("\n" + _EQ70)
     print("\nExamples to try:")
     print('  - "Create a critical ticket for login page returning 500 error, reported by Jane Smith, email jane@acme.com"')
     print('  - "Create a feature request for dark mode from Alex Chen"')
     print('  - "Create a ticket to update API docs"')
-    print("=" * 70)
+    print(_EQ70)
     
     # Get user input
     user_request = input("\nEnter your ticket request: ").strip()
@@ -192,9 +204,9 @@ def main():
         print("No request provided. Exiting.")
         return
     
-    print(f"\n{'─' * 70}")
+    print(f"\n{_DASH70}")
     print("Processing your request...")
-    print(f"{'─' * 70}\n")
+    print(f"{_DASH70}\n")
     
     # Create the conversation
     messages = [{"role": "user", "content": user_request}]
@@ -214,12 +226,12 @@ def main():
     # Process the response
     print("Claude's Analysis:")
     for block in response.content:
-        if hasattr(block, "text") and block.text:
+        if block.type == "text" and block.text:
             print(f"  {block.text}")
         elif block.type == "tool_use":
-            print(f"\n{'─' * 70}")
+            print(f"\n{_DASH70}")
             print("Tool Call Details:")
-            print(f"{'─' * 70}")
+            print(f"{_DASH70}")
             print(f"Tool: {block.name}")
             print(f"\nParameters:")
             print(json.dumps(block.input, indent=2))
@@ -227,9 +239,9 @@ def main():
             # Execute the tool
             result = process_tool_call(block.name, block.input)
             
-            print(f"\n{'─' * 70}")
+            print(f"\n{_DASH70}")
             print("Ticket Created:")
-            print(f"{'─' * 70}")
+            print(f"{_DASH70}")
             print(json.dumps(result, indent=2))
             
             # Get final response from Claude
@@ -253,20 +265,20 @@ def main():
                 }
             )
             
-            print(f"\n{'─' * 70}")
+            print(f"\n{_DASH70}")
             print("Final Response:")
-            print(f"{'─' * 70}")
+            print(f"{_DASH70}")
             for final_block in final_response.content:
-                if hasattr(final_block, "text"):
+                if final_block.type == "text":
                     print(final_block.text)
     
-    print(f"\n{'═' * 70}")
+    print(f"\n{_DEQ70}")
     print("✅ ANALYSIS: With tool use examples, you should see:")
     print("   - Consistent YYYY-MM-DD date format")
     print("   - Proper USR-XXXXX ID convention")
     print("   - Appropriate nested contact info for critical issues")
     print("   - Correct escalation correlation with priority level")
-    print(f"{'═' * 70}\n")
+    print(f"{_DEQ70}\n")
 
 if __name__ == "__main__":
     main()